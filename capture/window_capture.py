@@ -1,5 +1,7 @@
 import ctypes
-from ctypes import windll, wintypes
+import threading
+import zlib
+from ctypes import wintypes
 from PIL import Image
 from error_handler import safe_execute, SafeWindowCapture
 
@@ -19,31 +21,151 @@ class BITMAPINFOHEADER(ctypes.Structure):
         ('biClrImportant', ctypes.c_uint32),
     ]
 
+class BITMAPINFO(ctypes.Structure):
+    _fields_ = [
+        ('bmiHeader', BITMAPINFOHEADER),
+        ('bmiColors', ctypes.c_uint32 * 3),
+    ]
+
+# Private DLL handles so the prototypes below don't leak into other
+# modules' ctypes.windll calls
+_user32 = ctypes.WinDLL("user32")
+_gdi32 = ctypes.WinDLL("gdi32")
+
+EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+def _prototype(func, argtypes, restype):
+    func.argtypes = argtypes
+    func.restype = restype
+
+# Declaring the real signatures keeps handles pointer sized on 64-bit
+# Python and lets ctypes skip argument type guessing on every call
+_prototype(_user32.FindWindowW, [wintypes.LPCWSTR, wintypes.LPCWSTR], wintypes.HWND)
+_prototype(_user32.EnumWindows, [EnumWindowsProc, wintypes.LPARAM], wintypes.BOOL)
+_prototype(_user32.GetWindowTextLengthW, [wintypes.HWND], ctypes.c_int)
+_prototype(_user32.GetWindowTextW, [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int], ctypes.c_int)
+_prototype(_user32.IsWindowVisible, [wintypes.HWND], wintypes.BOOL)
+_prototype(_user32.GetWindowRect, [wintypes.HWND, ctypes.POINTER(wintypes.RECT)], wintypes.BOOL)
+_prototype(_user32.GetClientRect, [wintypes.HWND, ctypes.POINTER(wintypes.RECT)], wintypes.BOOL)
+_prototype(_user32.GetWindowDC, [wintypes.HWND], wintypes.HDC)
+_prototype(_user32.ReleaseDC, [wintypes.HWND, wintypes.HDC], ctypes.c_int)
+_prototype(_user32.PrintWindow, [wintypes.HWND, wintypes.HDC, wintypes.UINT], wintypes.BOOL)
+_prototype(_gdi32.CreateCompatibleDC, [wintypes.HDC], wintypes.HDC)
+_prototype(_gdi32.DeleteDC, [wintypes.HDC], wintypes.BOOL)
+_prototype(_gdi32.CreateDIBSection,
+           [wintypes.HDC, ctypes.POINTER(BITMAPINFO), wintypes.UINT,
+            ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD],
+           wintypes.HBITMAP)
+_prototype(_gdi32.SelectObject, [wintypes.HDC, wintypes.HGDIOBJ], wintypes.HGDIOBJ)
+_prototype(_gdi32.DeleteObject, [wintypes.HGDIOBJ], wintypes.BOOL)
+_prototype(_gdi32.BitBlt,
+           [wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+            wintypes.HDC, ctypes.c_int, ctypes.c_int, wintypes.DWORD],
+           wintypes.BOOL)
+_prototype(_gdi32.GdiFlush, [], wintypes.BOOL)
+
 class WindowCapture:
     def __init__(self, window_name=None):
+        # Guards the GDI objects and frame cache below; screenshots may be
+        # requested from more than one thread
+        self._capture_lock = threading.Lock()
         self.hwnd = None
+        # Capture target kept across frames; the DIB section is rebuilt only
+        # when the client size changes
+        self._mem_dc = None
+        self._dib = None
+        self._old_bitmap = None
+        self._dib_bits = ctypes.c_void_p()
+        self._dib_size = (0, 0)
+        self._bmi = BITMAPINFO()
+        self._bmi.bmiHeader.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+        self._bmi.bmiHeader.biPlanes = 1
+        self._bmi.bmiHeader.biBitCount = 32
+        self._bmi.bmiHeader.biCompression = 0  # BI_RGB
+        # Last decoded frame, returned as-is while the window content is static
+        self._last_frame_key = None
+        self._last_image = None
         if window_name:
-            self.hwnd = windll.user32.FindWindowW(None, window_name)
+            self.hwnd = _user32.FindWindowW(None, window_name)
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Releases the cached memory DC and DIB section."""
+        with self._capture_lock:
+            try:
+                self._release_dib()
+                if self._mem_dc:
+                    _gdi32.DeleteDC(self._mem_dc)
+            except Exception:
+                pass  # Ignore cleanup errors
+            self._mem_dc = None
+            self._last_frame_key = None
+            self._last_image = None
+
+    def _release_dib(self):
+        if self._dib:
+            if self._old_bitmap:
+                _gdi32.SelectObject(self._mem_dc, self._old_bitmap)
+            _gdi32.DeleteObject(self._dib)
+        self._dib = None
+        self._old_bitmap = None
+        self._dib_bits = ctypes.c_void_p()
+        self._dib_size = (0, 0)
+
+    def _ensure_dib(self, w, h):
+        """Makes sure a top-down 32bpp DIB section of w x h is selected into the memory DC."""
+        if self._dib and self._dib_size == (w, h):
+            return True
+
+        if not self._mem_dc:
+            self._mem_dc = _gdi32.CreateCompatibleDC(None)
+            if not self._mem_dc:
+                return False
+
+        self._release_dib()
+
+        self._bmi.bmiHeader.biWidth = w
+        self._bmi.bmiHeader.biHeight = -h  # Negative height flips the image upright (Top-Down)
+
+        bits = ctypes.c_void_p()
+        dib = _gdi32.CreateDIBSection(self._mem_dc, ctypes.byref(self._bmi), 0, ctypes.byref(bits), None, 0)
+        if not dib:
+            return False
+        if not bits.value:
+            _gdi32.DeleteObject(dib)
+            return False
+
+        self._old_bitmap = _gdi32.SelectObject(self._mem_dc, dib)
+        self._dib = dib
+        self._dib_bits = bits
+        self._dib_size = (w, h)
+        return True
 
     @safe_execute(default_return=[], log_errors=True, error_message="Failed to list window names")
     def list_window_names(self):
         """Returns a list of visible window titles."""
         titles = []
+        # Shared by every window and only grown for longer titles, which must
+        # come back whole for FindWindowW's exact match
+        buff = ctypes.create_unicode_buffer(256)
         def enum_windows_proc(hwnd, lParam):
+            nonlocal buff
             try:
-                length = windll.user32.GetWindowTextLengthW(hwnd)
-                if length > 0 and windll.user32.IsWindowVisible(hwnd):
-                    buff = ctypes.create_unicode_buffer(length + 1)
-                    windll.user32.GetWindowTextW(hwnd, buff, length + 1)
-                    titles.append(buff.value)
+                if _user32.IsWindowVisible(hwnd):
+                    length = _user32.GetWindowTextLengthW(hwnd)
+                    if length > 0:
+                        if length + 1 > len(buff):
+                            buff = ctypes.create_unicode_buffer(length + 1)
+                        _user32.GetWindowTextW(hwnd, buff, len(buff))
+                        titles.append(buff.value)
             except Exception:
                 pass  # Skip windows that cause errors
             return True
 
         try:
-            # Define the callback type for EnumWindows
-            EnumWindowsProc = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int))
-            windll.user32.EnumWindows(EnumWindowsProc(enum_windows_proc), 0)
+            _user32.EnumWindows(EnumWindowsProc(enum_windows_proc), 0)
         except Exception:
             pass  # Return empty list on error
         return titles
@@ -54,7 +176,7 @@ class WindowCapture:
             self.hwnd = None
             return
         try:
-            self.hwnd = windll.user32.FindWindowW(None, title)
+            self.hwnd = _user32.FindWindowW(None, title)
             # Validate the window handle
             if self.hwnd and not SafeWindowCapture.is_window_valid(self.hwnd):
                 self.hwnd = None
@@ -68,7 +190,7 @@ class WindowCapture:
             return 0, 0, 0, 0
         try:
             rect = wintypes.RECT()
-            if windll.user32.GetWindowRect(self.hwnd, ctypes.byref(rect)) == 0:
+            if _user32.GetWindowRect(self.hwnd, ctypes.byref(rect)) == 0:
                 return 0, 0, 0, 0
             w = rect.right - rect.left
             h = rect.bottom - rect.top
@@ -78,24 +200,22 @@ class WindowCapture:
         except Exception:
             return 0, 0, 0, 0
 
-    @safe_execute(default_return=None, log_errors=True, error_message="Failed to capture screenshot")
-    def screenshot(self):
+    def _capture_frame(self):
         """
-        Captures the specific window using PrintWindow (background capture).
-        Returns a PIL Image.
+        Renders the window's client area into the DIB section.
+        Returns (w, h) of the captured frame, or None on failure.
+        The caller must hold _capture_lock until it is done reading the DIB.
         """
         if not self.hwnd or not SafeWindowCapture.is_window_valid(self.hwnd):
             return None
 
         hwndDC = None
-        mfcDC = None
-        saveBitMap = None
 
         try:
             # Get Client Dimensions (Inner window area, excluding title bar)
             # Using GetClientRect ensures we don't get black borders
             rect = wintypes.RECT()
-            if windll.user32.GetClientRect(self.hwnd, ctypes.byref(rect)) == 0:
+            if _user32.GetClientRect(self.hwnd, ctypes.byref(rect)) == 0:
                 return None
             w = rect.right - rect.left
             h = rect.bottom - rect.top
@@ -103,72 +223,83 @@ class WindowCapture:
             if w == 0 or h == 0 or w > 10000 or h > 10000:  # Sanity check
                 return None
 
-            # Setup Bitmaps (GDI Magic)
-            hwndDC = windll.user32.GetWindowDC(self.hwnd)
-            if not hwndDC:
+            buffer_len = w * h * 4
+            if buffer_len <= 0 or buffer_len > 100000000:  # Sanity check (max ~100MB)
                 return None
 
-            mfcDC = windll.gdi32.CreateCompatibleDC(hwndDC)
-            if not mfcDC:
-                windll.user32.ReleaseDC(self.hwnd, hwndDC)
+            # Setup Bitmaps (GDI Magic)
+            if not self._ensure_dib(w, h):
                 return None
 
-            saveBitMap = windll.gdi32.CreateCompatibleBitmap(hwndDC, w, h)
-            if not saveBitMap:
-                windll.gdi32.DeleteDC(mfcDC)
-                windll.user32.ReleaseDC(self.hwnd, hwndDC)
+            hwndDC = _user32.GetWindowDC(self.hwnd)
+            if not hwndDC:
                 return None
 
-            windll.gdi32.SelectObject(mfcDC, saveBitMap)
-
             # PrintWindow
-            # The '2' flag is PW_CLIENTONLY - captures content only, no window frame
-            result = windll.user32.PrintWindow(self.hwnd, mfcDC, 2)
+            # The '2' flag is PW_RENDERFULLCONTENT - asks DWM for the window's full
+            # content, which is what makes DirectX/OpenGL games come out non-black.
+            # It's deliberately tried before BitBlt even for visible windows: a
+            # BitBlt of a GPU-rendered game is usually black, and for an occluded
+            # one would pick up whatever covers it (including our overlays)
+            result = _user32.PrintWindow(self.hwnd, self._mem_dc, 2)
 
             if result == 0:
                 # Fallback: Sometimes PrintWindow fails on hardware accelerated windows (chrome/electron)
                 # In that case, we can try BitBlt (standard screenshot)
-                windll.gdi32.BitBlt(mfcDC, 0, 0, w, h, hwndDC, 0, 0, 0x00CC0020)  # SRCCOPY
-
-            # Configure the Bitmap Header
-            bmpinfo = BITMAPINFOHEADER()
-            bmpinfo.biSize = ctypes.sizeof(BITMAPINFOHEADER)
-            bmpinfo.biWidth = w
-            bmpinfo.biHeight = -h  # Negative height flips the image upright (Top-Down)
-            bmpinfo.biPlanes = 1
-            bmpinfo.biBitCount = 32
-            bmpinfo.biCompression = 0  # BI_RGB
-
-            # Get the actual pixel data
-            buffer_len = w * h * 4
-            if buffer_len <= 0 or buffer_len > 100000000:  # Sanity check (max ~100MB)
-                return None
+                if not _gdi32.BitBlt(self._mem_dc, 0, 0, w, h, hwndDC, 0, 0, 0x00CC0020):  # SRCCOPY
+                    # Nothing was drawn, the reused DIB still holds the previous frame
+                    return None
+
+            # The DIB section is written directly by GDI, make sure it has finished
+            _gdi32.GdiFlush()
+            return w, h
+
+        except Exception:
+            return None
+        finally:
+            # The memory DC and DIB section are kept for the next frame
+            try:
+                if hwndDC and self.hwnd:
+                    _user32.ReleaseDC(self.hwnd, hwndDC)
+            except Exception:
+                pass  # Ignore cleanup errors
+
+    def _frame_buffer(self, w, h):
+        """Returns a ctypes view of the DIB section's BGRX pixels."""
+        return (ctypes.c_ubyte * (w * h * 4)).from_address(self._dib_bits.value)
 
-            buffer = ctypes.create_string_buffer(buffer_len)
+    def _frame_checksum(self, w, h):
+        """CRC32 over every pixel of the captured frame."""
+        return zlib.crc32(self._frame_buffer(w, h))
 
-            if windll.gdi32.GetDIBits(mfcDC, saveBitMap, 0, h, buffer, ctypes.byref(bmpinfo), 0) == 0:
+    @safe_execute(default_return=None, log_errors=True, error_message="Failed to capture screenshot")
+    def screenshot(self):
+        """
+        Captures the specific window using PrintWindow (background capture).
+        Returns a PIL Image. An unchanged frame returns the previous Image
+        object, so callers must treat it as read-only.
+        """
+        with self._capture_lock:
+            size = self._capture_frame()
+            if size is None:
                 return None
+            w, h = size
+
+            # Static scenes are the common case, skip the decode when nothing changed
+            frame_key = (w, h, self._frame_checksum(w, h))
+            if frame_key == self._last_frame_key and self._last_image is not None:
+                return self._last_image
 
             # Create PIL Image
             # Note: Windows bitmaps are usually BGRX, Pillow expects RGB or RGBA.
+            # BGRX is not a mappable raw mode, so Pillow decodes into its own
+            # storage here and the image doesn't alias the reused DIB memory.
             try:
-                image = Image.frombuffer("RGB", (w, h), buffer, "raw", "BGRX", 0, 1)
+                image = Image.frombuffer("RGB", (w, h), self._frame_buffer(w, h), "raw", "BGRX", 0, 1)
                 if not SafeWindowCapture.validate_image(image):
                     return None
+                self._last_frame_key = frame_key
+                self._last_image = image
                 return image
             except Exception:
                 return None
-
-        except Exception:
-            return None
-        finally:
-            # Always cleanup resources
-            try:
-                if saveBitMap:
-                    windll.gdi32.DeleteObject(saveBitMap)
-                if mfcDC:
-                    windll.gdi32.DeleteDC(mfcDC)
-                if hwndDC and self.hwnd:
-                    windll.user32.ReleaseDC(self.hwnd, hwndDC)
-            except Exception:
-                pass  # Ignore cleanup errors
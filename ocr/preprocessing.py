@@ -48,6 +48,7 @@ class ParamSpec:
     step: Any = None
     choices: list[str] | None = None
     tooltip: str = ""
+    expensive: bool = False  # UI applies changes on release instead of while dragging
 
 
 @dataclass
@@ -123,7 +124,7 @@ PreprocessingStep.register_specs(StepType.SHARPEN, [
 PreprocessingStep.register_specs(StepType.DENOISE, [
     ParamSpec("strength", "Denoise Strength", "int", default=10,
               min_val=1, max_val=30, step=1,
-              tooltip="Higher = smoother but may lose detail."),
+              tooltip="Higher = smoother but may lose detail.", expensive=True),
     ParamSpec("method", "Method", "choice", default="nlmeans",
               choices=["nlmeans", "bilateral", "median", "gaussian"],
               tooltip="Denoising algorithm. NL-Means is best quality."),
@@ -403,6 +404,10 @@ class PreprocessingPipeline:
                               params={"pixels": 8, "color": "white"}),
         ]
 
+    @property
+    def has_enabled_steps(self) -> bool:
+        return any(step.enabled for step in self.steps)
+
     def process(self, image: Image.Image) -> Image.Image:
         """Run all enabled steps on the image."""
         result = image.copy()
@@ -419,6 +424,24 @@ class PreprocessingPipeline:
                 continue
         return result
 
+    def copy(self) -> PreprocessingPipeline:
+        """Return an independent snapshot of the steps.
+
+        Params dicts are shared with the snapshot: editors replace a step's
+        params dict on change rather than mutating it in place.
+        """
+        return PreprocessingPipeline(steps=[
+            PreprocessingStep(step.step_type, step.enabled, step.params)
+            for step in self.steps
+        ])
+
+    def signature(self) -> tuple:
+        """Hashable summary of the configuration, for caching processed output."""
+        return tuple(
+            (step.step_type, step.enabled, tuple(sorted(step.params.items())))
+            for step in self.steps
+        )
+
     def to_dict(self) -> list[dict]:
         """Serialize pipeline configuration."""
         return [
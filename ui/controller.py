@@ -208,7 +208,11 @@ class ControllerWindow(QtWidgets.QWidget):
 
         # Page 2: Settings
         from ui.settings_page import SettingsPageWidget
-        self.settings_page = SettingsPageWidget(self.ocr_manager, has_cuda=self._has_cuda)
+        self.settings_page = SettingsPageWidget(
+            self.ocr_manager,
+            has_cuda=self._has_cuda,
+            translator_provider=lambda: self.translator,
+        )
         self.settings_page.engine_changed.connect(self._on_engine_changed_from_settings)
         self.settings_page.interval_changed.connect(self._on_interval_changed)
         self.settings_page.preprocess_toggled.connect(
@@ -217,7 +221,6 @@ class ControllerWindow(QtWidgets.QWidget):
         self.settings_page.exit_requested.connect(self._exit_application)
         self.settings_page.overlay_bg_color_changed.connect(self._on_overlay_bg_color_changed)
         self.settings_page.overlay_text_color_changed.connect(self._on_overlay_text_color_changed)
-        self.settings_page.set_translator_loaded(self.translator is not None)
         self.settings_page.set_interval(self.prefs.pipeline_interval)
         self.settings_page.set_overlay_colors(self.prefs.overlay_bg_color, self.prefs.overlay_text_color)
         # Set initial engine loading status
@@ -1016,11 +1019,13 @@ class ControllerWindow(QtWidgets.QWidget):
         if self.ocr_manager:
             self.prefs.preprocessing_pipeline = self.ocr_manager.pipeline.to_dict()
 
+    @QtCore.pyqtSlot(int)
     def _on_interval_changed(self, value: int) -> None:
         """Handle pipeline interval change from settings page."""
         self.timer.setInterval(value)
         self.prefs.pipeline_interval = value
 
+    @QtCore.pyqtSlot(str)
     def _on_overlay_bg_color_changed(self, color_hex: str) -> None:
         """Handle overlay background color change from settings."""
         self.prefs.overlay_bg_color = color_hex
@@ -1029,6 +1034,7 @@ class ControllerWindow(QtWidgets.QWidget):
             if overlay:
                 overlay.set_bg_color(color_hex)
 
+    @QtCore.pyqtSlot(str)
     def _on_overlay_text_color_changed(self, color_hex: str) -> None:
         """Handle overlay text color change from settings."""
         self.prefs.overlay_text_color = color_hex
@@ -1037,6 +1043,7 @@ class ControllerWindow(QtWidgets.QWidget):
             if overlay:
                 overlay.set_text_color(color_hex)
 
+    @QtCore.pyqtSlot()
     def _exit_application(self) -> None:
         """Clean shutdown of the application."""
         # Stop translation
@@ -1061,6 +1068,7 @@ class ControllerWindow(QtWidgets.QWidget):
 
     # ---- Engine change from settings ----
 
+    @QtCore.pyqtSlot(int)
     def _on_engine_changed_from_settings(self, engine_type_value: int) -> None:
         """Handle OCR engine change from settings page."""
         try:
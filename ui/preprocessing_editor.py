@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from functools import partial
 from typing import TYPE_CHECKING, Callable
 
 from PyQt6 import QtWidgets, QtCore, QtGui
@@ -14,6 +16,162 @@ if TYPE_CHECKING:
     from ocr.manager import OCRManager
 
 
+# Last captured preview per region, kept in the per-user cache directory
+# (%LOCALAPPDATA%\cache on Windows) so the checkout stays clean
+_PREVIEW_CACHE_DIR = os.path.join(
+    QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.StandardLocation.GenericCacheLocation),
+    "UniversalJapaneseGameTranslator", "preview_cache",
+)
+_PREVIEW_CACHE_MAX_FILES = 10
+
+
+# Step editor styles, applied once on PreprocessingEditorWidget and matched by objectName
+STEP_HEADER_SS = """
+    QWidget#stepHeader {
+        background-color: #1A1A1A;
+        border: 1px solid #333333;
+        border-radius: 6px;
+    }
+    QCheckBox#stepEnable {
+        background-color: transparent;
+        border: none;
+    }
+    QCheckBox#stepEnable::indicator {
+        width: 14px;
+        height: 14px;
+    }
+    QLabel#stepName {
+        color: #EEEEEE;
+        background-color: transparent;
+        font-weight: 500;
+        font-size: 12px;
+        border: none;
+    }
+    QPushButton#stepExpand {
+        background-color: transparent;
+        border: none;
+    }
+"""
+
+STEP_PARAMS_SS = """
+    QWidget#stepParams {
+        background-color: #151515;
+        border: 1px solid #2A2A2A;
+        border-top: none;
+        border-bottom-left-radius: 6px;
+        border-bottom-right-radius: 6px;
+    }
+    QWidget#stepParams QComboBox {
+        background-color: #151515;
+        border: 1px solid #2A2A2A;
+        border-top: none;
+        border-bottom-left-radius: 6px;
+        border-bottom-right-radius: 6px;
+    }
+    QSlider#paramSlider {
+        background-color: transparent;
+        border: none;
+    }
+"""
+
+PARAM_LABEL_SS = """
+    QCheckBox#paramCheck {
+        color: #CCCCCC;
+        background-color: transparent;
+        font-size: 11px;
+        border: none;
+    }
+    ParamLabel {
+        color: #AAAAAA;
+        background-color: transparent;
+        font-size: 11px;
+        border: none;
+    }
+    ValueLabel {
+        color: #AAAAAA;
+        background-color: transparent;
+        min-width: 35px;
+        font-size: 11px;
+        border: none;
+    }
+"""
+
+STEP_EDITOR_SS = STEP_HEADER_SS + STEP_PARAMS_SS + PARAM_LABEL_SS
+
+
+def _save_cached_preview(region_id: str, image: Image.Image) -> None:
+    """Store a raw preview capture on disk, evicting the oldest beyond the cap."""
+    try:
+        os.makedirs(_PREVIEW_CACHE_DIR, exist_ok=True)
+        image.save(os.path.join(_PREVIEW_CACHE_DIR, f"{region_id}.webp"), quality=90)
+        files = sorted(
+            (os.path.join(_PREVIEW_CACHE_DIR, name) for name in os.listdir(_PREVIEW_CACHE_DIR)
+             if name.endswith(".webp")),
+            key=os.path.getmtime,
+        )
+        for path in files[:-_PREVIEW_CACHE_MAX_FILES]:
+            os.remove(path)
+    except Exception as e:
+        print(f"Warning: Failed to cache preview image: {e}")
+
+
+def _load_latest_cached_preview() -> Image.Image | None:
+    """Load the most recently cached preview capture, if any."""
+    try:
+        if not os.path.isdir(_PREVIEW_CACHE_DIR):
+            return None
+        files = [os.path.join(_PREVIEW_CACHE_DIR, name) for name in os.listdir(_PREVIEW_CACHE_DIR)
+                 if name.endswith(".webp")]
+        if not files:
+            return None
+        with Image.open(max(files, key=os.path.getmtime)) as img:
+            return img.convert("RGB")
+    except Exception as e:
+        print(f"Warning: Failed to load cached preview image: {e}")
+        return None
+
+
+class ParamLabel(QtWidgets.QLabel):
+    """Parameter name label, styled by type selector in STEP_EDITOR_SS."""
+
+
+class ValueLabel(QtWidgets.QLabel):
+    """Slider value readout, styled by type selector in STEP_EDITOR_SS."""
+
+
+class _PreviewSignals(QtCore.QObject):
+    """Signals used by preview workers to hand results back to the GUI thread."""
+
+    finished = QtCore.pyqtSignal(int, object)  # (seq, processed PIL image)
+    failed = QtCore.pyqtSignal(int, str)       # (seq, message to display)
+
+
+class _PreviewWorker(QtCore.QRunnable):
+    """Runs a pipeline snapshot on a preview image in the global thread pool."""
+
+    def __init__(self, pipeline: PreprocessingPipeline, image: Image.Image,
+                 seq: int, signals: _PreviewSignals):
+        super().__init__()
+        self._pipeline = pipeline
+        self._image = image
+        self._seq = seq
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            try:
+                if self._pipeline.has_enabled_steps:
+                    processed = self._pipeline.process(self._image)
+                else:
+                    processed = self._image
+            except Exception as e:
+                self._signals.failed.emit(self._seq, f"Error: {e}")
+                return
+            self._signals.finished.emit(self._seq, processed)
+        except RuntimeError:
+            pass  # Signals holder was torn down (application shutting down)
+
+
 class StepEditorWidget(QtWidgets.QWidget):
     """Editable UI for a single preprocessing step with collapsible parameters."""
 
@@ -23,6 +181,8 @@ class StepEditorWidget(QtWidgets.QWidget):
         self._on_change = on_change_callback
         self._is_expanded = False
         self._param_controls: dict[str, QtWidgets.QWidget] = {}
+        self._value_labels: dict[str, ValueLabel] = {}
+        self._specs = PreprocessingStep.get_param_specs(step.step_type)
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -32,13 +192,7 @@ class StepEditorWidget(QtWidgets.QWidget):
 
         # ── Header row ──
         header = QtWidgets.QWidget()
-        header.setStyleSheet("""
-            QWidget {
-                background-color: #1A1A1A;
-                border: 1px solid #333333;
-                border-radius: 6px;
-            }
-        """)
+        header.setObjectName("stepHeader")
         header_layout = QtWidgets.QHBoxLayout()
         header_layout.setContentsMargins(10, 6, 10, 6)
         header_layout.setSpacing(8)
@@ -47,30 +201,19 @@ class StepEditorWidget(QtWidgets.QWidget):
         self.enable_check = QtWidgets.QCheckBox()
         self.enable_check.setChecked(self._step.enabled)
         self.enable_check.setFixedWidth(20)
-        self.enable_check.setStyleSheet(
-            "QCheckBox { background-color: transparent; border: none; }"
-            "QCheckBox::indicator { width: 14px; height: 14px; }"
-        )
+        self.enable_check.setObjectName("stepEnable")
         self.enable_check.toggled.connect(self._on_enable_toggled)
         header_layout.addWidget(self.enable_check)
 
         # Step name
         name = self._step.step_type.name.replace("_", " ").title()
         name_label = QtWidgets.QLabel(name)
-        name_label.setStyleSheet(
-            "color: #EEEEEE; background-color: transparent; "
-            "font-weight: 500; font-size: 12px; border: none;"
-        )
+        name_label.setObjectName("stepName")
         header_layout.addWidget(name_label, 1)
 
         # Expand/collapse button
         self.expand_btn = IconButton("chevron-right", size=24)
-        self.expand_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        self.expand_btn.setObjectName("stepExpand")
         self.expand_btn.clicked.connect(self.toggle_expand)
         header_layout.addWidget(self.expand_btn)
 
@@ -79,21 +222,12 @@ class StepEditorWidget(QtWidgets.QWidget):
 
         # ── Params area (collapsible) ──
         self.params_widget = QtWidgets.QWidget()
-        self.params_widget.setStyleSheet("""
-            QWidget {
-                background-color: #151515;
-                border: 1px solid #2A2A2A;
-                border-top: none;
-                border-bottom-left-radius: 6px;
-                border-bottom-right-radius: 6px;
-            }
-        """)
+        self.params_widget.setObjectName("stepParams")
         params_layout = QtWidgets.QVBoxLayout()
         params_layout.setContentsMargins(24, 10, 16, 14)
         params_layout.setSpacing(10)
 
-        specs = PreprocessingStep.get_param_specs(self._step.step_type)
-        for spec in specs:
+        for spec in self._specs:
             control_row = self._create_param_control(spec)
             if control_row is not None:
                 params_layout.addLayout(control_row) if isinstance(
@@ -113,15 +247,10 @@ class StepEditorWidget(QtWidgets.QWidget):
         if spec.type == "bool":
             check = QtWidgets.QCheckBox(spec.label)
             check.setChecked(bool(current_val))
-            check.setStyleSheet(
-                "color: #CCCCCC; background-color: transparent; "
-                "font-size: 11px; border: none;"
-            )
+            check.setObjectName("paramCheck")
             if spec.tooltip:
                 check.setToolTip(spec.tooltip)
-            check.toggled.connect(
-                lambda val, n=spec.name: self._update_param(n, val)
-            )
+            check.toggled.connect(partial(self._update_param, spec.name))
             self._param_controls[spec.name] = check
             return check
 
@@ -130,12 +259,8 @@ class StepEditorWidget(QtWidgets.QWidget):
             row.setContentsMargins(0, 2, 0, 2)
             row.setSpacing(12)
 
-            label = QtWidgets.QLabel(spec.label)
+            label = ParamLabel(spec.label)
             label.setMinimumWidth(90)
-            label.setStyleSheet(
-                "color: #AAAAAA; background-color: transparent; "
-                "font-size: 11px; border: none;"
-            )
             row.addWidget(label)
 
             combo = ModernComboBox()
@@ -146,9 +271,7 @@ class StepEditorWidget(QtWidgets.QWidget):
                 combo.setCurrentIndex(idx)
             if spec.tooltip:
                 combo.setToolTip(spec.tooltip)
-            combo.currentTextChanged.connect(
-                lambda val, n=spec.name: self._update_param(n, val)
-            )
+            combo.currentTextChanged.connect(partial(self._update_param, spec.name))
             self._param_controls[spec.name] = combo
             row.addWidget(combo, 1)
             return row
@@ -158,17 +281,13 @@ class StepEditorWidget(QtWidgets.QWidget):
             row.setContentsMargins(0, 2, 0, 2)
             row.setSpacing(12)
 
-            label = QtWidgets.QLabel(spec.label)
+            label = ParamLabel(spec.label)
             label.setMinimumWidth(90)
-            label.setStyleSheet(
-                "color: #AAAAAA; background-color: transparent; "
-                "font-size: 11px; border: none;"
-            )
             row.addWidget(label)
 
             slider = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
             slider.setFixedHeight(22)
-            slider.setStyleSheet("background-color: transparent; border: none;")
+            slider.setObjectName("paramSlider")
 
             # For float, multiply by precision factor
             if spec.type == "float":
@@ -180,21 +299,15 @@ class StepEditorWidget(QtWidgets.QWidget):
                 slider.setRange(s_min, s_max)
                 slider.setValue(s_val)
 
-                val_label = QtWidgets.QLabel(f"{float(current_val):.1f}")
-                val_label.setStyleSheet(
-                    "color: #AAAAAA; background-color: transparent; "
-                    "min-width: 35px; font-size: 11px; border: none;"
-                )
+                val_label = ValueLabel(f"{float(current_val):.1f}")
                 val_label.setAlignment(
                     QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
                 )
 
-                def on_float_change(v, n=spec.name, p=precision, lbl=val_label):
-                    real_val = v / p
-                    lbl.setText(f"{real_val:.1f}")
-                    self._update_param(n, real_val)
-
-                slider.valueChanged.connect(on_float_change)
+                slider.valueChanged.connect(
+                    partial(self._on_float_change, spec.name, precision, val_label)
+                )
+                slider.sliderMoved.connect(partial(self._show_float_value, precision, val_label))
             else:
                 s_min = int(spec.min_val) if spec.min_val is not None else 0
                 s_max = int(spec.max_val) if spec.max_val is not None else 100
@@ -203,33 +316,49 @@ class StepEditorWidget(QtWidgets.QWidget):
                 slider.setSingleStep(s_step)
                 slider.setValue(int(current_val))
 
-                val_label = QtWidgets.QLabel(str(int(current_val)))
-                val_label.setStyleSheet(
-                    "color: #AAAAAA; background-color: transparent; "
-                    "min-width: 35px; font-size: 11px; border: none;"
-                )
+                val_label = ValueLabel(str(int(current_val)))
                 val_label.setAlignment(
                     QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
                 )
 
-                def on_int_change(v, n=spec.name, lbl=val_label):
-                    lbl.setText(str(v))
-                    self._update_param(n, v)
+                slider.valueChanged.connect(partial(self._on_int_change, spec.name, val_label))
+                slider.sliderMoved.connect(partial(self._show_int_value, val_label))
 
-                slider.valueChanged.connect(on_int_change)
+            # Expensive params only commit on release; sliderMoved keeps the label live
+            slider.setTickPosition(QtWidgets.QSlider.TickPosition.NoTicks)
+            slider.setTracking(not spec.expensive)
 
             if spec.tooltip:
                 slider.setToolTip(spec.tooltip)
 
             self._param_controls[spec.name] = slider
+            self._value_labels[spec.name] = val_label
             row.addWidget(slider, 1)
             row.addWidget(val_label)
             return row
 
         return None
 
+    @staticmethod
+    def _show_float_value(precision: int, label: QtWidgets.QLabel, value: int) -> None:
+        label.setText(f"{value / precision:.1f}")
+
+    @staticmethod
+    def _show_int_value(label: QtWidgets.QLabel, value: int) -> None:
+        label.setText(str(value))
+
+    def _on_float_change(self, name: str, precision: int, label: QtWidgets.QLabel,
+                         value: int) -> None:
+        self._show_float_value(precision, label, value)
+        self._update_param(name, value / precision)
+
+    def _on_int_change(self, name: str, label: QtWidgets.QLabel, value: int) -> None:
+        self._show_int_value(label, value)
+        self._update_param(name, value)
+
     def _update_param(self, name: str, value) -> None:
-        self._step.params[name] = value
+        # Copy-on-write so pipeline snapshots can share params dicts safely
+        self._step.params = {**self._step.params, name: value}
         self._on_change()
 
     def _on_enable_toggled(self, checked: bool) -> None:
@@ -242,14 +371,22 @@ class StepEditorWidget(QtWidgets.QWidget):
         self.expand_btn.icon_type = "chevron-right" if not self._is_expanded else "chevron-left"
         self.expand_btn.update()
 
+    @property
+    def step(self) -> PreprocessingStep:
+        return self._step
+
+    def set_step(self, step: PreprocessingStep) -> None:
+        """Rebind this editor to another step of the same type."""
+        self._step = step
+        self.update_from_step()
+
     def update_from_step(self) -> None:
         """Re-read step state and update all controls."""
         self.enable_check.blockSignals(True)
         self.enable_check.setChecked(self._step.enabled)
         self.enable_check.blockSignals(False)
 
-        specs = PreprocessingStep.get_param_specs(self._step.step_type)
-        for spec in specs:
+        for spec in self._specs:
             control = self._param_controls.get(spec.name)
             if control is None:
                 continue
@@ -266,8 +403,13 @@ class StepEditorWidget(QtWidgets.QWidget):
                     step_v = spec.step if spec.step else 0.1
                     precision = max(1, round(1.0 / step_v))
                     control.setValue(int(float(val) * precision))
+                    val_text = f"{float(val):.1f}"
                 else:
                     control.setValue(int(val))
+                    val_text = str(int(val))
+                val_label = self._value_labels.get(spec.name)
+                if val_label is not None:
+                    val_label.setText(val_text)
             control.blockSignals(False)
 
 
@@ -290,6 +432,15 @@ class PreprocessingEditorWidget(QtWidgets.QWidget):
         self._preview_image: Image.Image | None = None
         self._step_editors: list[StepEditorWidget] = []
 
+        # Background preview processing; stale results are dropped by sequence number
+        self._preview_seq = 0
+        self._preview_key = ""
+        self._capture_generation = 0
+        # Unparented so in-flight workers keep it alive if this widget is destroyed
+        self._preview_signals = _PreviewSignals()
+        self._preview_signals.finished.connect(self._on_preview_ready)
+        self._preview_signals.failed.connect(self._on_preview_failed)
+
         # Debounce timer for preview refresh
         self._preview_timer = QtCore.QTimer()
         self._preview_timer.setSingleShot(True)
@@ -298,7 +449,16 @@ class PreprocessingEditorWidget(QtWidgets.QWidget):
 
         self._setup_ui()
 
+        # Warm start: show the last captured preview from a previous session
+        cached = _load_latest_cached_preview()
+        if cached is not None:
+            self._preview_image = cached
+            self._refresh_preview()
+
     def _setup_ui(self) -> None:
+        # Shared step editor styles, parsed once for all StepEditorWidgets
+        self.setStyleSheet(STEP_EDITOR_SS)
+
         layout = QtWidgets.QVBoxLayout()
         layout.setContentsMargins(4, 8, 4, 8)
         layout.setSpacing(12)
@@ -426,18 +586,23 @@ class PreprocessingEditorWidget(QtWidgets.QWidget):
 
     def _build_step_editors(self) -> None:
         """Create step editor widgets from the current pipeline."""
-        # Clear existing
-        for editor in self._step_editors:
-            self.steps_layout.removeWidget(editor)
-            editor.deleteLater()
-        self._step_editors.clear()
-
-        for step in self._ocr_manager.pipeline.steps:
-            editor = StepEditorWidget(step, on_change_callback=self._on_param_changed)
-            self.steps_layout.addWidget(editor)
-            self._step_editors.append(editor)
-
-        self.steps_layout.addStretch()
+        self.steps_container.setUpdatesEnabled(False)
+        try:
+            # Clear existing editors and the trailing stretch in one pass
+            while (item := self.steps_layout.takeAt(0)) is not None:
+                widget = item.widget()
+                if widget is not None:
+                    widget.deleteLater()
+            self._step_editors.clear()
+
+            for step in self._ocr_manager.pipeline.steps:
+                editor = StepEditorWidget(step, on_change_callback=self._on_param_changed)
+                self.steps_layout.addWidget(editor)
+                self._step_editors.append(editor)
+
+            self.steps_layout.addStretch()
+        finally:
+            self.steps_container.setUpdatesEnabled(True)
 
     def _on_param_changed(self) -> None:
         """Debounced callback when any step parameter changes."""
@@ -449,11 +614,34 @@ class PreprocessingEditorWidget(QtWidgets.QWidget):
         """Run preprocessing on the preview image and update display."""
         if self._preview_image is None:
             return
-        try:
-            processed = self._ocr_manager.pipeline.process(self._preview_image)
-            self._set_preview_pixmap(self.preview_processed, processed)
-        except Exception as e:
-            self.preview_processed.setText(f"Error: {e}")
+        self._preview_seq += 1
+        pipeline = self._ocr_manager.pipeline.copy()
+
+        # Reuse the thumbnail if this capture was already rendered with this config
+        self._preview_key = self._make_preview_key(pipeline)
+        cached = QtGui.QPixmapCache.find(self._preview_key)
+        if cached is not None:
+            self.preview_processed.setPixmap(cached)
+            return
+
+        worker = _PreviewWorker(
+            pipeline, self._preview_image, self._preview_seq, self._preview_signals,
+        )
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _make_preview_key(self, pipeline: PreprocessingPipeline) -> str:
+        return f"preview:{self._capture_generation}:{hash(pipeline.signature()):x}"
+
+    def _on_preview_ready(self, seq: int, processed: Image.Image) -> None:
+        if seq != self._preview_seq:
+            return
+        if self._set_preview_pixmap(self.preview_processed, processed):
+            QtGui.QPixmapCache.insert(self._preview_key, self.preview_processed.pixmap())
+
+    def _on_preview_failed(self, seq: int, message: str) -> None:
+        if seq != self._preview_seq:
+            return
+        self.preview_processed.setText(message)
 
     def _capture_preview_image(self) -> None:
         """Capture the overlay region selected in the combo box."""
@@ -464,15 +652,20 @@ class PreprocessingEditorWidget(QtWidgets.QWidget):
         if not region_id:
             self.preview_processed.setText("No overlay selected")
             return
+        # The capture shares WindowCapture's GDI state with the pipeline timer,
+        # so it stays on the GUI thread; only the processing goes to the pool
         try:
             img = self._capture_callback(region_id)
             if img is None:
                 self.preview_processed.setText("Capture failed")
                 return
-            self._preview_image = img.convert("RGB")
-            self._refresh_preview()
+            self._preview_image = img if img.mode == "RGB" else img.convert("RGB")
+            self._capture_generation += 1
+            _save_cached_preview(region_id, self._preview_image)
         except Exception as e:
             self.preview_processed.setText(f"Capture error: {e}")
+            return
+        self._refresh_preview()
 
     def refresh_overlay_list(self) -> None:
         """Refresh the overlay selector combo from the current active regions."""
@@ -500,7 +693,18 @@ class PreprocessingEditorWidget(QtWidgets.QWidget):
     def _reset_to_defaults(self) -> None:
         """Reset pipeline to default steps."""
         self._ocr_manager.pipeline = PreprocessingPipeline()
-        self._build_step_editors()
+        new_steps = self._ocr_manager.pipeline.steps
+
+        # Reuse existing editors when the step layout is unchanged
+        if [s.step_type for s in new_steps] == [e.step.step_type for e in self._step_editors]:
+            self.setUpdatesEnabled(False)
+            try:
+                for editor, step in zip(self._step_editors, new_steps):
+                    editor.set_step(step)
+            finally:
+                self.setUpdatesEnabled(True)
+        else:
+            self._build_step_editors()
         self._refresh_preview()
         if self._on_pipeline_changed:
             self._on_pipeline_changed()
@@ -508,6 +712,11 @@ class PreprocessingEditorWidget(QtWidgets.QWidget):
     @staticmethod
     def _pil_to_qpixmap(image: Image.Image, max_size: int = 360) -> QtGui.QPixmap:
         """Convert PIL image to QPixmap, scaling down if needed."""
+        # Downscale in PIL so Qt only receives the final thumbnail
+        if max(image.size) > max_size:
+            image = image.copy()
+            image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+
         # Handle grayscale
         if image.mode == "L":
             arr_bytes = image.tobytes()
@@ -534,19 +743,14 @@ class PreprocessingEditorWidget(QtWidgets.QWidget):
                 QtGui.QImage.Format.Format_RGB888,
             )
 
-        pixmap = QtGui.QPixmap.fromImage(qimg)
-        if pixmap.width() > max_size or pixmap.height() > max_size:
-            pixmap = pixmap.scaled(
-                max_size, max_size,
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
-            )
-        return pixmap
+        return QtGui.QPixmap.fromImage(qimg)
 
-    def _set_preview_pixmap(self, label: QtWidgets.QLabel, image: Image.Image) -> None:
-        """Set a PIL image onto a QLabel as a pixmap."""
+    def _set_preview_pixmap(self, label: QtWidgets.QLabel, image: Image.Image) -> bool:
+        """Set a PIL image onto a QLabel as a pixmap. Returns True on success."""
         try:
             pixmap = self._pil_to_qpixmap(image, max_size=360)
             label.setPixmap(pixmap)
+            return True
         except Exception as e:
             label.setText(f"Display error: {e}")
+            return False
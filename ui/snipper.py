@@ -9,6 +9,19 @@ class Snipper(QtWidgets.QWidget):
         self.begin = QtCore.QPoint()
         self.end = QtCore.QPoint()
 
+        # Paint resources, built once instead of on every mouse-move repaint
+        self._dim_brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 80))
+        self._selection_pen = QtGui.QPen(QtGui.QColor("red"))
+        self._selection_pen.setWidth(2)
+        self._selection_brush = QtGui.QBrush(QtCore.Qt.BrushStyle.NoBrush)
+
+        # Coalesce mouse moves to at most one repaint per frame
+        self._pending_end = QtCore.QPoint()
+        self._move_timer = QtCore.QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._flush_move)
+
         self.setWindowFlags(
             QtCore.Qt.WindowType.FramelessWindowHint
             | QtCore.Qt.WindowType.WindowStaysOnTopHint
@@ -41,32 +54,43 @@ class Snipper(QtWidgets.QWidget):
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # type: ignore[override]
         painter = QtGui.QPainter(self)
 
-        # Light dim over the whole screen
-        painter.fillRect(self.rect(), QtGui.QColor(0, 0, 0, 80))
+        # Light dim over the whole screen (only the invalidated part is repainted)
+        painter.fillRect(event.rect(), self._dim_brush)
 
         if self.begin == self.end:
             return
 
-        pen = QtGui.QPen(QtGui.QColor("red"))
-        pen.setWidth(2)
-        painter.setPen(pen)
+        painter.setPen(self._selection_pen)
 
         # Transparent fill for the selected box so you can see the text clearly
-        painter.setBrush(QtGui.QColor(0, 0, 0, 0))
+        painter.setBrush(self._selection_brush)
 
-        rect = QtCore.QRect(self.begin, self.end)
-        painter.drawRect(rect.normalized())
+        painter.drawRect(QtCore.QRect(self.begin, self.end).normalized())
 
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:  # type: ignore[override]
-        self.begin = event.pos()
+        self.begin = event.position().toPoint()
         self.end = self.begin
         self.update()
 
     def mouseMoveEvent(self, event: QtGui.QMouseEvent) -> None:  # type: ignore[override]
-        self.end = event.pos()
-        self.update()
+        self._pending_end = event.position().toPoint()
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _flush_move(self) -> None:
+        # Repaint just the area the selection box covered before and after the move
+        dirty = self._selection_rect()
+        self.end = self._pending_end
+        self.update(dirty.united(self._selection_rect()))
+
+    def _selection_rect(self) -> QtCore.QRect:
+        """Area covered by the selection box, padded for the pen width."""
+        return QtCore.QRect(self.begin, self.end).normalized().adjusted(-2, -2, 2, 2)
 
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:  # type: ignore[override]
+        if self._move_timer.isActive():
+            self._move_timer.stop()
+            self._flush_move()
         rect = QtCore.QRect(self.begin, self.end).normalized()
 
         # Handle cases where user just clicked without dragging
@@ -179,9 +179,214 @@ DARK_THEME_STYLESHEET = """
         color: #EEEEEE;
         font-weight: 400;
     }
+
+    /* Overlay list items */
+    OverlayListItem {
+        background-color: transparent;
+        border-radius: 6px;
+        padding: 2px;
+    }
+
+    OverlayListItem:hover {
+        background-color: rgba(70, 70, 70, 120);
+    }
+
+    OverlayListItem QLabel {
+        color: #EEEEEE;
+        background-color: transparent;
+        font-size: 13px;
+        font-weight: 400;
+    }
+
+    OverlayListItem QPushButton,
+    OverlayListItem QPushButton:hover,
+    OverlayListItem QPushButton:pressed {
+        background-color: transparent;
+        border: none;
+        border-radius: 6px;
+    }
+
+    /* Settings page */
+    SettingsPageWidget QLabel {
+        color: #CCCCCC;
+        background-color: transparent;
+        font-size: 11px;
+    }
+
+    SettingsPageWidget QLabel#sectionHeader {
+        font-weight: 500;
+    }
+
+    SettingsPageWidget QLabel#gpuNote {
+        color: #777777;
+        font-size: 10px;
+        font-style: italic;
+    }
+
+    SettingsPageWidget QLabel#fieldLabel {
+        color: #999999;
+        font-size: 10px;
+    }
+
+    SettingsPageWidget QLabel#aboutSub {
+        color: #888888;
+        font-size: 10px;
+    }
+
+    SettingsPageWidget QLabel#translatorStatus {
+        padding: 2px 0px;
+    }
+
+    SettingsPageWidget QLabel#translatorStatus[state="ok"] {
+        color: #7BC67E;
+    }
+
+    SettingsPageWidget QLabel#translatorStatus[state="err"] {
+        color: #FF6B6B;
+    }
+
+    SettingsPageWidget QLabel#engineStatus {
+        color: #888888;
+        font-size: 10px;
+    }
+
+    SettingsPageWidget QLabel#engineStatus[state="loading"] {
+        color: #FFB347;
+    }
+
+    SettingsPageWidget QLabel#engineStatus[state="loaded"] {
+        color: #7BC67E;
+    }
+
+    SettingsPageWidget QRadioButton {
+        color: #CCCCCC;
+        background-color: transparent;
+        font-size: 11px;
+        spacing: 6px;
+    }
+
+    SettingsPageWidget QRadioButton:disabled {
+        color: #666666;
+    }
+
+    SettingsPageWidget QRadioButton::indicator {
+        width: 14px;
+        height: 14px;
+    }
+
+    SettingsPageWidget QRadioButton::indicator:unchecked {
+        border: 2px solid #606060;
+        border-radius: 8px;
+        background-color: transparent;
+    }
+
+    SettingsPageWidget QRadioButton::indicator:unchecked:disabled {
+        border-color: #404040;
+    }
+
+    SettingsPageWidget QRadioButton::indicator:checked {
+        border: 2px solid #5599FF;
+        border-radius: 8px;
+        background-color: #5599FF;
+    }
+
+    SettingsPageWidget QCheckBox {
+        color: #CCCCCC;
+        background-color: transparent;
+        font-size: 11px;
+    }
+
+    SettingsPageWidget QLineEdit {
+        background-color: #1A1A1A;
+        color: #AAAAAA;
+        border: 1px solid #404040;
+        border-radius: 6px;
+        padding: 6px 10px;
+        font-size: 11px;
+    }
+
+    SettingsPageWidget QSpinBox {
+        background-color: #1A1A1A;
+        color: #EEEEEE;
+        border: 1px solid #404040;
+        border-radius: 6px;
+        padding: 4px 8px;
+        font-size: 11px;
+        min-width: 70px;
+    }
+
+    SettingsPageWidget QSpinBox:focus {
+        border-color: #5599FF;
+    }
+
+    SettingsPageWidget QSpinBox::up-button, SettingsPageWidget QSpinBox::down-button {
+        background-color: #2A2A2A;
+        border: 1px solid #404040;
+        width: 16px;
+    }
+
+    SettingsPageWidget QSpinBox::up-button:hover, SettingsPageWidget QSpinBox::down-button:hover {
+        background-color: #3A3A3A;
+    }
+
+    SettingsPageWidget QSpinBox::up-arrow {
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-bottom: 5px solid #AAAAAA;
+        width: 0px; height: 0px;
+    }
+
+    SettingsPageWidget QSpinBox::down-arrow {
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 5px solid #AAAAAA;
+        width: 0px; height: 0px;
+    }
+
+    SettingsPageWidget ColorSwatch {
+        background-color: transparent;
+        border: 1px solid #606060;
+        border-radius: 4px;
+        min-height: 0px;
+        padding: 0px;
+    }
+
+    SettingsPageWidget ColorSwatch:hover {
+        background-color: transparent;
+        border-color: #909090;
+        border-width: 2px;
+    }
+
+    SettingsPageWidget ColorSwatch:pressed {
+        background-color: transparent;
+    }
+
+    SettingsPageWidget QPushButton#exitButton {
+        background-color: #8B2020;
+        color: #EEEEEE;
+        border: 1px solid #A03030;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-size: 12px;
+        font-weight: 500;
+    }
+
+    SettingsPageWidget QPushButton#exitButton:hover {
+        background-color: #A03030;
+        border-color: #C04040;
+    }
+
+    SettingsPageWidget QPushButton#exitButton:pressed {
+        background-color: #6B1515;
+    }
 """
 
 
 def apply_dark_styles(widget: QtWidgets.QWidget) -> None:
     """Apply the dark theme stylesheet to the given widget."""
+    # Re-setting an identical sheet still re-parses it and repolishes the subtree
+    if widget.styleSheet() == DARK_THEME_STYLESHEET:
+        return
     widget.setStyleSheet(DARK_THEME_STYLESHEET)
@@ -1,9 +1,32 @@
+import sys
+
 from PyQt6 import QtWidgets, QtCore, QtGui
-from error_handler import safe_execute
 from ui.widgets import SpinnerWidget
 
+# Cursor shown for each resize edge/corner
+_CURSOR_MAP = {
+    "n": QtCore.Qt.CursorShape.SizeVerCursor,
+    "s": QtCore.Qt.CursorShape.SizeVerCursor,
+    "e": QtCore.Qt.CursorShape.SizeHorCursor,
+    "w": QtCore.Qt.CursorShape.SizeHorCursor,
+    "ne": QtCore.Qt.CursorShape.SizeBDiagCursor,
+    "nw": QtCore.Qt.CursorShape.SizeFDiagCursor,
+    "se": QtCore.Qt.CursorShape.SizeFDiagCursor,
+    "sw": QtCore.Qt.CursorShape.SizeBDiagCursor,
+}
+
 
 class TextBoxOverlay(QtWidgets.QLabel):
+    # Static text styling; the text color lives in the palette so changing it
+    # doesn't re-parse the stylesheet
+    TEXT_STYLE = """
+        font-size: 14px;
+        font-weight: 400;
+        font-family: 'Segoe UI', 'Microsoft YaHei UI', sans-serif;
+        padding: 12px 16px;
+        line-height: 1.5;
+    """
+
     # Signal emitted when position or size changes
     geometry_changed = QtCore.pyqtSignal(int, int, int, int)  # x, y, width, height
     # Signal emitted when the overlay is closed via its close button
@@ -12,6 +35,30 @@ class TextBoxOverlay(QtWidgets.QLabel):
     interaction_started = QtCore.pyqtSignal()
     interaction_finished = QtCore.pyqtSignal()
 
+    CLOSE_BUTTON_SIZE = 26
+    CLOSE_BUTTON_MARGIN = 6
+    CLOSE_BUTTON_STYLE = """
+        QPushButton {
+            background-color: rgba(60, 60, 60, 180);
+            border: 1px solid rgba(120, 120, 120, 120);
+            border-radius: 13px;
+            color: #FFFFFF;
+            font-weight: bold;
+            font-size: 20px;
+            font-family: Arial, sans-serif;
+            padding: 0px;
+            text-align: center;
+        }
+        QPushButton:hover {
+            background-color: rgba(80, 80, 80, 220);
+            border-color: rgba(160, 160, 160, 180);
+            color: #FFFFFF;
+        }
+        QPushButton:pressed {
+            background-color: rgba(100, 100, 100, 240);
+        }
+    """
+
     def __init__(self, x, y, w, h, initial_opacity=200, bg_color="#0D0D0D", text_color="#EEEEEE"):
         super().__init__()
         self.setGeometry(x, y, w, h)
@@ -19,9 +66,15 @@ class TextBoxOverlay(QtWidgets.QLabel):
         # State variable to hold opacity
         self.bg_opacity = initial_opacity
 
-        # Custom colors
+        # Custom colors, parsed once and kept as QColor
         self.bg_color = QtGui.QColor(bg_color)
-        self.text_color = text_color
+        self.text_color = QtGui.QColor(text_color)
+
+        # Paint resources, rebuilt only when opacity or background color change
+        self._hover_pen = QtGui.QPen(QtGui.QColor(100, 160, 220, 220), 2)
+        # Rendered backgrounds keyed by (size, device pixel ratio, highlighted)
+        self._bg_cache: dict[tuple, QtGui.QPixmap] = {}
+        self._update_paint_cache()
 
         # Window Flags - frameless, no-focus to prevent game stalling
         self.setWindowFlags(
@@ -41,6 +94,20 @@ class TextBoxOverlay(QtWidgets.QLabel):
         self.resize_handle_size = 10
         self.min_size = 50
 
+        # Drag/resize target, applied at most every 8ms so high-rate mouse
+        # input doesn't queue a window move per event
+        self._pending_geometry = None
+        self._move_throttle = QtCore.QTimer(self)
+        self._move_throttle.setSingleShot(True)
+        self._move_throttle.setInterval(8)
+        self._move_throttle.timeout.connect(self._apply_pending_geometry)
+
+        # geometry_changed is debounced while moving; release emits the final rect
+        self._geom_debounce = QtCore.QTimer(self)
+        self._geom_debounce.setSingleShot(True)
+        self._geom_debounce.setInterval(30)
+        self._geom_debounce.timeout.connect(self._emit_geometry_now)
+
         # Close button visibility state
         self.close_button_visible = False
 
@@ -50,41 +117,21 @@ class TextBoxOverlay(QtWidgets.QLabel):
         # Text settings
         self.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self.setWordWrap(True)
-        self.setText("Translated Text Goes Here...")
+        self._last_text = "Translated Text Goes Here..."
+        self.setText(self._last_text)
 
         # Set text style with custom color
-        self._apply_text_style()
+        self.setStyleSheet(self.TEXT_STYLE)
+        self._apply_text_color()
 
         # Enable mouse tracking for hover effects
         self.setMouseTracking(True)
 
-        # Create close button (initially hidden)
-        self.close_button = QtWidgets.QPushButton("×", self)
-        self.close_button.setFixedSize(26, 26)
-        self.close_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(60, 60, 60, 180);
-                border: 1px solid rgba(120, 120, 120, 120);
-                border-radius: 13px;
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 20px;
-                font-family: Arial, sans-serif;
-                padding: 0px;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: rgba(80, 80, 80, 220);
-                border-color: rgba(160, 160, 160, 180);
-                color: #FFFFFF;
-            }
-            QPushButton:pressed {
-                background-color: rgba(100, 100, 100, 240);
-            }
-        """)
-        self.close_button.hide()  # Hidden by default
-        self.close_button.clicked.connect(self._on_close_clicked)
+        # Close button, created on first hover; its rect is tracked from the
+        # start so hit-testing and the spinner can be positioned without it
+        self.close_button = None
         self.update_close_button_position()
+        self._update_edge_rects()
 
         # Translation spinner (shown when OCR/translation is in progress)
         self.spinner = SpinnerWidget(size=18, color="#FFFFFF", thickness=2, parent=self)
@@ -95,13 +142,18 @@ class TextBoxOverlay(QtWidgets.QLabel):
 
     def _apply_noactivate_style(self):
         """Apply Win32 WS_EX_NOACTIVATE to prevent game focus loss on click."""
+        if sys.platform != "win32":
+            return
         try:
             import ctypes
             hwnd = int(self.winId())
             GWL_EXSTYLE = -20
             WS_EX_NOACTIVATE = 0x08000000
             style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
-            ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE, style | WS_EX_NOACTIVATE)
+            # Qt already maps WindowDoesNotAcceptFocus to this bit; only
+            # patch the window if it is missing
+            if not style & WS_EX_NOACTIVATE:
+                ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE, style | WS_EX_NOACTIVATE)
         except Exception:
             pass
 
@@ -109,20 +161,52 @@ class TextBoxOverlay(QtWidgets.QLabel):
         """Handle close button click - emit signal so controller can clean up."""
         self.close_requested.emit()
 
+    def _create_close_button(self) -> None:
+        """Build the close button the first time it is needed."""
+        self.close_button = QtWidgets.QPushButton("×", self)
+        self.close_button.setFixedSize(self.CLOSE_BUTTON_SIZE, self.CLOSE_BUTTON_SIZE)
+        self.close_button.setStyleSheet(self.CLOSE_BUTTON_STYLE)
+        self.close_button.clicked.connect(self._on_close_clicked)
+        self.close_button.setGeometry(self._close_button_rect)
+
     def update_close_button_position(self):
         """Update close button position to top-right corner."""
-        margin = 6
-        self.close_button.move(
-            self.width() - self.close_button.width() - margin,
-            margin
+        size = self.CLOSE_BUTTON_SIZE
+        margin = self.CLOSE_BUTTON_MARGIN
+        self._close_button_rect = QtCore.QRect(self.width() - size - margin, margin, size, size)
+        if self.close_button is not None:
+            self.close_button.move(self._close_button_rect.topLeft())
+
+    def _update_edge_rects(self) -> None:
+        """Precompute resize hit-test bands and the border repaint region."""
+        w, h = self.width(), self.height()
+        hs = self.resize_handle_size
+        # Corners first so they win over edges
+        self._edge_rects = (
+            ("nw", QtCore.QRect(0, 0, hs, hs)),
+            ("ne", QtCore.QRect(w - hs, 0, hs, hs)),
+            ("sw", QtCore.QRect(0, h - hs, hs, hs)),
+            ("se", QtCore.QRect(w - hs, h - hs, hs, hs)),
+            ("n", QtCore.QRect(0, 0, w, hs)),
+            ("s", QtCore.QRect(0, h - hs, w, hs)),
+            ("w", QtCore.QRect(0, 0, hs, h)),
+            ("e", QtCore.QRect(w - hs, 0, hs, h)),
         )
+        # Everything the border can touch: a thin band along the edges plus
+        # the rounded corners, which curve further in
+        rect = self.rect()
+        corner = 14
+        region = QtGui.QRegion(rect).subtracted(QtGui.QRegion(rect.adjusted(3, 3, -3, -3)))
+        for x, y in ((0, 0), (w - corner, 0), (0, h - corner), (w - corner, h - corner)):
+            region = region.united(QtCore.QRect(x, y, corner, corner))
+        self._border_region = region
 
     def _update_spinner_position(self):
         """Position spinner to the left of the close button."""
         margin = 6
         self.spinner.move(
-            self.close_button.x() - self.spinner.width() - 4,
-            margin + (self.close_button.height() - self.spinner.height()) // 2
+            self._close_button_rect.x() - self.spinner.width() - 4,
+            margin + (self._close_button_rect.height() - self.spinner.height()) // 2
         )
 
     def set_translating(self, translating: bool) -> None:
@@ -136,12 +220,15 @@ class TextBoxOverlay(QtWidgets.QLabel):
         """Handle resize events to reposition close button and spinner."""
         super().resizeEvent(event)
         self.update_close_button_position()
+        self._update_edge_rects()
         self._update_spinner_position()
 
     def enterEvent(self, event: QtGui.QEnterEvent) -> None:
         """Show close button when mouse enters the widget."""
         super().enterEvent(event)
         self.close_button_visible = True
+        if self.close_button is None:
+            self._create_close_button()
         self.close_button.show()
         self.update()
 
@@ -149,109 +236,89 @@ class TextBoxOverlay(QtWidgets.QLabel):
         """Hide close button when mouse leaves the widget."""
         super().leaveEvent(event)
         self.close_button_visible = False
-        self.close_button.hide()
-        self.hover_edge = None
-        self.update()
+        if self.close_button is not None:
+            self.close_button.hide()
+        if self.hover_edge is not None:
+            self.hover_edge = None
+            self.update(self._border_region)
 
-    @safe_execute(default_return=None, log_errors=False, error_message="Failed to set opacity")
     def set_background_opacity(self, alpha: int) -> None:
         """Update the background opacity and trigger a repaint."""
         try:
             alpha = max(0, min(255, int(alpha)))
             self.bg_opacity = alpha
+            self._update_paint_cache()
             self.update()
         except Exception:
             pass
 
-    def _apply_text_style(self) -> None:
-        """Apply text stylesheet with current text color."""
-        self.setStyleSheet(f"""
-            color: {self.text_color};
-            font-size: 14px;
-            font-weight: 400;
-            font-family: 'Segoe UI', 'Microsoft YaHei UI', sans-serif;
-            padding: 12px 16px;
-            line-height: 1.5;
-            background-color: transparent;
-        """)
-
-    def set_bg_color(self, color_hex: str) -> None:
+    def _update_paint_cache(self) -> None:
+        """Rebuild the background brush and normal border pen from current state."""
+        brush_color = QtGui.QColor(self.bg_color)
+        brush_color.setAlpha(self.bg_opacity)
+        self._bg_brush = QtGui.QBrush(brush_color)
+        border_alpha = min(200, int(self.bg_opacity * 0.8))
+        self._border_pen = QtGui.QPen(QtGui.QColor(80, 80, 80, border_alpha), 1)
+        self._bg_cache.clear()
+
+    def _apply_text_color(self) -> None:
+        """Apply the current text color through the palette."""
+        palette = self.palette()
+        palette.setColor(QtGui.QPalette.ColorRole.WindowText, self.text_color)
+        self.setPalette(palette)
+
+    def set_bg_color(self, color: str | QtGui.QColor) -> None:
         """Update the overlay background color."""
-        self.bg_color = QtGui.QColor(color_hex)
+        color = QtGui.QColor(color)
+        if color == self.bg_color:
+            return
+        self.bg_color = color
+        self._update_paint_cache()
         self.update()
 
-    def set_text_color(self, color_hex: str) -> None:
+    def set_text_color(self, color: str | QtGui.QColor) -> None:
         """Update the overlay text color."""
-        self.text_color = color_hex
-        self._apply_text_style()
+        color = QtGui.QColor(color)
+        if color == self.text_color:
+            return
+        self.text_color = color
+        self._apply_text_color()
         self.update()
 
-    @safe_execute(default_return=None, log_errors=False, error_message="Failed to update text")
     def update_text(self, text: str) -> None:
         """Update the overlay text."""
         try:
             if text is None:
                 text = ""
-            text = str(text)[:1000]
+            elif not isinstance(text, str):
+                text = str(text)
+            text = text[:1000]
+            # Repeated identical results are common; skip the relayout
+            if text == self._last_text:
+                return
+            self._last_text = text
             self.setText(text)
         except Exception:
             pass
 
     def get_resize_edge(self, pos: QtCore.QPoint) -> str | None:
         """Determine which resize edge/corner the mouse is over."""
-        x, y = pos.x(), pos.y()
-        w, h = self.width(), self.height()
-        handle_size = self.resize_handle_size
-        
-        # Don't allow resizing from top-right corner if close button is visible
-        close_button_rect = self.close_button.geometry()
-        if self.close_button_visible and close_button_rect.contains(pos):
+        # Don't allow resizing from under the close button
+        if self.close_button_visible and self._close_button_rect.contains(pos):
             return None
-
-        # Check corners first (but skip top-right if close button is there)
-        if x < handle_size and y < handle_size:
-            return "nw"
-        elif x >= w - handle_size and y < handle_size:
-            # Skip if mouse is over close button area
-            if not (self.close_button_visible and close_button_rect.contains(pos)):
-                return "ne"
-        elif x < handle_size and y >= h - handle_size:
-            return "sw"
-        elif x >= w - handle_size and y >= h - handle_size:
-            return "se"
-        # Check edges
-        elif y < handle_size:
-            # Skip top edge if mouse is over close button
-            if not (self.close_button_visible and close_button_rect.contains(pos)):
-                return "n"
-        elif y >= h - handle_size:
-            return "s"
-        elif x < handle_size:
-            return "w"
-        elif x >= w - handle_size:
-            # Skip right edge if mouse is over close button
-            if not (self.close_button_visible and close_button_rect.contains(pos)):
-                return "e"
+        for edge, rect in self._edge_rects:
+            if rect.contains(pos):
+                return edge
         return None
 
     def get_cursor_for_edge(self, edge: str | None) -> QtCore.Qt.CursorShape:
         """Get the appropriate cursor for a resize edge."""
-        cursor_map = {
-            "n": QtCore.Qt.CursorShape.SizeVerCursor,
-            "s": QtCore.Qt.CursorShape.SizeVerCursor,
-            "e": QtCore.Qt.CursorShape.SizeHorCursor,
-            "w": QtCore.Qt.CursorShape.SizeHorCursor,
-            "ne": QtCore.Qt.CursorShape.SizeBDiagCursor,
-            "nw": QtCore.Qt.CursorShape.SizeFDiagCursor,
-            "se": QtCore.Qt.CursorShape.SizeFDiagCursor,
-            "sw": QtCore.Qt.CursorShape.SizeBDiagCursor,
-        }
-        return cursor_map.get(edge, QtCore.Qt.CursorShape.ArrowCursor)
+        return _CURSOR_MAP.get(edge, QtCore.Qt.CursorShape.ArrowCursor)
 
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
         """Handle mouse press for dragging and resizing."""
         # Don't process if clicking on close button
-        if self.close_button.underMouse():
+        if self.close_button is not None and self.close_button.underMouse():
             event.accept()
             return
 
@@ -276,118 +343,161 @@ class TextBoxOverlay(QtWidgets.QLabel):
             # Update hover state for visual feedback
             if edge != self.hover_edge:
                 self.hover_edge = edge
-                self.update()
+                self.update(self._border_region)
         elif event.buttons() & QtCore.Qt.MouseButton.LeftButton:
             if self.resize_edge is None:
                 # Dragging mode - move the window
                 new_pos = event.globalPosition().toPoint() - self.drag_start_position
-                self.move(new_pos)
-                self._emit_geometry_changed()
+                self._schedule_geometry(QtCore.QRect(new_pos, self.size()))
             else:
                 # Resizing mode - adjust size based on edge/corner
                 global_pos = event.globalPosition().toPoint()
                 delta = global_pos - self.drag_start_position
+                dx, dy = delta.x(), delta.y()
 
                 # Start with original geometry from when resizing started
-                start_rect = self.resize_start_geometry
-                new_x = start_rect.x()
-                new_y = start_rect.y()
-                new_width = start_rect.width()
-                new_height = start_rect.height()
+                sx, sy, sw, sh = self.resize_start_geometry.getRect()
+                new_x, new_y, new_width, new_height = sx, sy, sw, sh
 
                 edge = self.resize_edge
 
                 # Handle horizontal resizing
                 if "e" in edge:
                     # Dragging east edge - increase width
-                    new_width = start_rect.width() + delta.x()
+                    new_width = sw + dx
                 elif "w" in edge:
                     # Dragging west edge - move left and increase width
-                    new_width = start_rect.width() - delta.x()
-                    new_x = start_rect.x() + delta.x()
+                    new_width = sw - dx
+                    new_x = sx + dx
 
                 # Handle vertical resizing
                 if "s" in edge:
                     # Dragging south edge - increase height
-                    new_height = start_rect.height() + delta.y()
+                    new_height = sh + dy
                 elif "n" in edge:
                     # Dragging north edge - move up and increase height
-                    new_height = start_rect.height() - delta.y()
-                    new_y = start_rect.y() + delta.y()
+                    new_height = sh - dy
+                    new_y = sy + dy
 
                 # Apply minimum size constraints
                 if new_width < self.min_size:
                     if "w" in edge:
                         # When dragging west edge, don't move if at minimum
-                        new_x = start_rect.x() + start_rect.width() - self.min_size
+                        new_x = sx + sw - self.min_size
                     new_width = self.min_size
 
                 if new_height < self.min_size:
                     if "n" in edge:
                         # When dragging north edge, don't move if at minimum
-                        new_y = start_rect.y() + start_rect.height() - self.min_size
+                        new_y = sy + sh - self.min_size
                     new_height = self.min_size
 
                 # Apply new geometry
-                self.setGeometry(new_x, new_y, new_width, new_height)
-                self._emit_geometry_changed()
+                self._schedule_geometry(QtCore.QRect(new_x, new_y, new_width, new_height))
         event.accept()
 
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:
         """Handle mouse release to stop dragging/resizing."""
         if event.button() == QtCore.Qt.MouseButton.LeftButton:
+            # Land on the final position and report it before ending the interaction
+            self._apply_pending_geometry()
+            if self._geom_debounce.isActive():
+                self._emit_geometry_now()
             self.drag_start_position = None
             self.resize_edge = None
             self.resize_start_geometry = None
             # Update cursor based on current position
             edge = self.get_resize_edge(event.pos())
             self.setCursor(self.get_cursor_for_edge(edge))
+            self.update()
             self.interaction_finished.emit()
         event.accept()
 
-    @safe_execute(default_return=None, log_errors=False, error_message="Failed to emit geometry changed")
+    def _schedule_geometry(self, rect: QtCore.QRect) -> None:
+        """Queue a drag/resize target; intermediate targets are coalesced."""
+        self._pending_geometry = rect
+        if not self._move_throttle.isActive():
+            self._move_throttle.start()
+
+    def _apply_pending_geometry(self) -> None:
+        """Apply the latest queued drag/resize target, if any."""
+        self._move_throttle.stop()
+        rect = self._pending_geometry
+        if rect is None:
+            return
+        self._pending_geometry = None
+        # Only touch the part that changed; a drag never needs a resize
+        if rect.topLeft() != self.pos():
+            self.move(rect.topLeft())
+        if rect.size() != self.size():
+            self.resize(rect.size())
+        self._emit_geometry_changed()
+
     def _emit_geometry_changed(self) -> None:
+        """Schedule a geometry_changed emission, restarting the debounce."""
+        self._geom_debounce.start()
+
+    def _emit_geometry_now(self) -> None:
         """Emit signal with current geometry."""
+        self._geom_debounce.stop()
         try:
-            rect = self.geometry()
-            if rect.width() > 0 and rect.height() > 0:
-                self.geometry_changed.emit(rect.x(), rect.y(), rect.width(), rect.height())
+            x, y, w, h = self.geometry().getRect()
+            if w > 0 and h > 0:
+                self.geometry_changed.emit(x, y, w, h)
         except Exception:
             pass
 
+    def _draw_background(self, painter: QtGui.QPainter, highlighted: bool) -> None:
+        """Draw the rounded background and border."""
+        # Semi-transparent background with custom color
+        painter.setBrush(self._bg_brush)
+
+        # Border - brighter when hovering over a resize edge or resizing,
+        # otherwise a subtle line that fades with the background
+        painter.setPen(self._hover_pen if highlighted else self._border_pen)
+
+        # Draw rounded rectangle with more rounded corners
+        painter.drawRoundedRect(self.rect().adjusted(0, 0, -1, -1), 12, 12)
+
+    def _background_pixmap(self, highlighted: bool) -> QtGui.QPixmap:
+        """Return the antialiased background for the current state, rendering it once."""
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr, highlighted)
+        pixmap = self._bg_cache.get(key)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+            painter = QtGui.QPainter(pixmap)
+            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+            self._draw_background(painter, highlighted)
+            painter.end()
+            # Normal and highlighted variants for a couple of sizes is plenty
+            if len(self._bg_cache) >= 4:
+                del self._bg_cache[next(iter(self._bg_cache))]
+            self._bg_cache[key] = pixmap
+        return pixmap
+
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
         """Draw a rounded translucent rectangle with modern border."""
+        if event.region().isEmpty() or not self.isVisible():
+            return
+        painter = QtGui.QPainter(self)
+        if not painter.isActive():
+            return
         try:
-            painter = QtGui.QPainter(self)
-            if not painter.isActive():
-                return
-
-            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-
-            # Semi-transparent background with custom color
-            brush_color = QtGui.QColor(self.bg_color.red(), self.bg_color.green(), self.bg_color.blue(), self.bg_opacity)
-            painter.setBrush(QtGui.QBrush(brush_color))
-
-            # Border color - highlight if hovering over resize edge or dragging
-            if self.hover_edge or self.resize_edge:
-                # Brighter border when hovering over resize edge
-                pen_color = QtGui.QColor(100, 160, 220, 220)
-                border_width = 2
+            highlighted = bool(self.hover_edge or self.resize_edge)
+            if self.resize_edge is None:
+                painter.drawPixmap(0, 0, self._background_pixmap(highlighted))
             else:
-                # Normal subtle border
-                border_alpha = min(200, int(self.bg_opacity * 0.8))
-                pen_color = QtGui.QColor(80, 80, 80, border_alpha)
-                border_width = 1
-
-            painter.setPen(QtGui.QPen(pen_color, border_width))
-
-            # Draw rounded rectangle with more rounded corners
-            painter.drawRoundedRect(self.rect().adjusted(0, 0, -1, -1), 12, 12)
-
-            # Draw the text on top
-            super().paintEvent(event)
+                # The size changes every frame while resizing, so caching
+                # would only add work; aliased edges are fine until release
+                self._draw_background(painter, highlighted)
         except Exception:
-            try:
-                super().paintEvent(event)
-            except Exception:
-                pass
+            pass
+        finally:
+            # Release the device before QLabel opens its own painter
+            painter.end()
+
+        # Draw the text on top
+        super().paintEvent(event)
@@ -3,48 +3,138 @@
 from PyQt6 import QtWidgets, QtCore, QtGui
 
 
+def _build_gear_teeth() -> QtGui.QPainterPath:
+    """Six flat-topped teeth around the origin, one every 60 degrees."""
+    tooth = QtGui.QPainterPath()
+    # Wide rounded rect: flat top with rounded corners
+    tooth.addRoundedRect(QtCore.QRectF(-4.0, -12.0, 8.0, 6.5), 2.0, 2.0)
+    teeth = QtGui.QPainterPath()
+    for i in range(6):
+        teeth.addPath(QtGui.QTransform().rotate(i * 60.0).map(tooth))
+    return teeth
+
+
+# Gear teeth are constant, so build them once instead of rotating per paint
+_GEAR_TEETH = _build_gear_teeth()
+
+# Polygon outlines relative to their anchor point, translated into place
+# when painting instead of being rebuilt point by point
+_ARROW_OPEN = QtGui.QPolygon([QtCore.QPoint(-4, -2), QtCore.QPoint(4, -2), QtCore.QPoint(0, 3)])
+_ARROW_CLOSED = QtGui.QPolygon([QtCore.QPoint(-2, -4), QtCore.QPoint(-2, 4), QtCore.QPoint(3, 0)])
+_PLAY_TRIANGLE = QtGui.QPolygon([QtCore.QPoint(-6, -9), QtCore.QPoint(-6, 9), QtCore.QPoint(10, 0)])
+_REFRESH_ARROW_HEAD = QtGui.QPolygon([QtCore.QPoint(6, -8), QtCore.QPoint(6, -2), QtCore.QPoint(10, -5)])
+_IMAGE_MOUNTAIN = QtGui.QPolygon([QtCore.QPoint(-6, 4), QtCore.QPoint(-2, -1), QtCore.QPoint(2, 4)])
+_PENCIL_BODY = QtGui.QPolygon([QtCore.QPoint(-3, 2), QtCore.QPoint(6, -7), QtCore.QPoint(9, -4), QtCore.QPoint(0, 5)])
+_PENCIL_TIP = QtGui.QPolygon([QtCore.QPoint(-3, 2), QtCore.QPoint(0, 5), QtCore.QPoint(-6, 8)])
+_PENCIL_LEAD = QtGui.QPolygon([QtCore.QPoint(-5, 5), QtCore.QPoint(-3, 7), QtCore.QPoint(-6, 8)])
+_HOUSE_ROOF = QtGui.QPolygon([QtCore.QPoint(0, -8), QtCore.QPoint(-9, -1), QtCore.QPoint(9, -1)])
+
+# Multi-stroke icons, relative to the icon centre and drawn in one call
+_CLOSE_LINES = [QtCore.QLine(-6, -6, 6, 6), QtCore.QLine(6, -6, -6, 6)]
+_CHEVRON_LEFT_LINES = [
+    QtCore.QLine(2, -6, -3, 0), QtCore.QLine(-3, 0, 2, 6),
+    QtCore.QLine(6, -6, 1, 0), QtCore.QLine(1, 0, 6, 6),
+]
+_CHEVRON_RIGHT_LINES = [
+    QtCore.QLine(-6, -6, -1, 0), QtCore.QLine(-1, 0, -6, 6),
+    QtCore.QLine(-2, -6, 3, 0), QtCore.QLine(3, 0, -2, 6),
+]
+_IMAGE_PENCIL_LINES = [QtCore.QLine(2, 7, 9, 0), QtCore.QLine(9, 0, 7, 1)]
+
+
 class SpinnerWidget(QtWidgets.QWidget):
     """Animated spinning arc indicator."""
 
+    # Pre-rendered animation frames shared by all spinners, keyed by
+    # (size, color, thickness, device pixel ratio, angle)
+    _frame_cache: dict[tuple[int, int, int, float, int], QtGui.QPixmap] = {}
+
     def __init__(self, size: int = 18, color: str = "#AAAAAA", thickness: int = 2, parent=None):
         super().__init__(parent)
         self.setFixedSize(size, size)
         self._color = QtGui.QColor(color)
         self._thickness = thickness
+        self._pen = QtGui.QPen(self._color, thickness)
+        self._pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
         self._angle = 0
-        self._timer = QtCore.QTimer(self)
-        self._timer.timeout.connect(self._rotate)
+        # Created on first start; only ticks while running and actually visible
+        self._timer: QtCore.QTimer | None = None
+        self._running = False
         self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground)
         self.hide()
 
     def start(self):
         """Start the spinning animation and show the widget."""
-        self._timer.start(50)
-        self.show()
+        self._running = True
+        if self.isVisible():
+            self._start_timer()
+        else:
+            self.show()
 
     def stop(self):
         """Stop the spinning animation and hide the widget."""
-        self._timer.stop()
+        self._running = False
+        if self._timer is not None:
+            self._timer.stop()
         self.hide()
 
+    def _start_timer(self):
+        if self._timer is None:
+            self._timer = QtCore.QTimer(self)
+            self._timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
+            self._timer.setInterval(50)
+            self._timer.timeout.connect(self._rotate)
+        self._timer.start()
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        if self._running:
+            self._start_timer()
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        # Also fires when an ancestor (e.g. an inactive page) is hidden
+        super().hideEvent(event)
+        if self._timer is not None:
+            self._timer.stop()
+
     def _rotate(self):
         self._angle = (self._angle + 30) % 360
         self.update()
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        pen = QtGui.QPen(self._color, self._thickness)
-        pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
-        painter.setPen(pen)
-        margin = self._thickness
-        rect = self.rect().adjusted(margin, margin, -margin, -margin)
-        painter.drawArc(rect, self._angle * 16, 270 * 16)
+        painter.drawPixmap(0, 0, self._frame_pixmap())
+        painter.end()
+
+    def _frame_pixmap(self) -> QtGui.QPixmap:
+        """Return the arc for the current angle, drawing it on first use.
+
+        The angle only moves in 30 degree steps, so there are 12 frames.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self._color.rgba(), self._thickness, dpr, self._angle)
+        pixmap = self._frame_cache.get(key)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+            painter = QtGui.QPainter(pixmap)
+            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+            painter.setPen(self._pen)
+            margin = self._thickness
+            rect = self.rect().adjusted(margin, margin, -margin, -margin)
+            painter.drawArc(rect, self._angle * 16, 270 * 16)
+            painter.end()
+            self._frame_cache[key] = pixmap
+        return pixmap
 
 
 class ModernComboBox(QtWidgets.QComboBox):
     """Custom ComboBox with animated arrow."""
 
+    _ARROW_PEN = QtGui.QPen(QtGui.QColor(170, 170, 170), 2, QtCore.Qt.PenStyle.SolidLine, QtCore.Qt.PenCapStyle.RoundCap)
+    _ARROW_BRUSH = QtGui.QBrush(QtGui.QColor(170, 170, 170))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.is_popup_shown = False
@@ -63,81 +153,135 @@ class ModernComboBox(QtWidgets.QComboBox):
 
     def paintEvent(self, event: QtGui.QPaintEvent):
         """Custom paint to draw arrow."""
-        super().paintEvent(event)
-
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-
-        # Draw arrow on the right side
-        arrow_x = self.width() - 24
-        arrow_y = self.height() // 2
-
-        painter.setPen(QtGui.QPen(QtGui.QColor(170, 170, 170), 2, QtCore.Qt.PenStyle.SolidLine, QtCore.Qt.PenCapStyle.RoundCap))
-
-        if self.is_popup_shown:
-            # Down-pointing triangle when open
-            triangle = QtGui.QPolygon([
-                QtCore.QPoint(arrow_x - 4, arrow_y - 2),
-                QtCore.QPoint(arrow_x + 4, arrow_y - 2),
-                QtCore.QPoint(arrow_x, arrow_y + 3)
-            ])
-        else:
-            # Right-pointing triangle when closed
-            triangle = QtGui.QPolygon([
-                QtCore.QPoint(arrow_x - 2, arrow_y - 4),
-                QtCore.QPoint(arrow_x - 2, arrow_y + 4),
-                QtCore.QPoint(arrow_x + 3, arrow_y)
-            ])
-
-        painter.setBrush(QtGui.QColor(170, 170, 170))
-        painter.drawPolygon(triangle)
+        # Same as QComboBox.paintEvent, minus the style's own arrow, which the
+        # theme hides and the triangle below replaces
+        painter = QtWidgets.QStylePainter(self)
+        try:
+            painter.setPen(self.palette().color(QtGui.QPalette.ColorRole.Text))
+            opt = QtWidgets.QStyleOptionComboBox()
+            self.initStyleOption(opt)
+            opt.subControls &= ~QtWidgets.QStyle.SubControl.SC_ComboBoxArrow
+            painter.drawComplexControl(QtWidgets.QStyle.ComplexControl.CC_ComboBox, opt)
+            if self.currentIndex() < 0 and self.placeholderText():
+                opt.palette.setBrush(QtGui.QPalette.ColorRole.ButtonText, opt.palette.placeholderText())
+                opt.currentText = self.placeholderText()
+            painter.drawControl(QtWidgets.QStyle.ControlElement.CE_ComboBoxLabel, opt)
+
+            # Draw arrow on the right side
+            arrow_x = self.width() - 24
+            arrow_y = self.height() // 2
+
+            # Skip the arrow when only another part of the combo was invalidated
+            if not event.rect().intersects(QtCore.QRect(arrow_x - 6, arrow_y - 6, 12, 12)):
+                return
+
+            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+
+            painter.setPen(self._ARROW_PEN)
+
+            if self.is_popup_shown:
+                # Down-pointing triangle when open
+                triangle = _ARROW_OPEN.translated(arrow_x, arrow_y)
+            else:
+                # Right-pointing triangle when closed
+                triangle = _ARROW_CLOSED.translated(arrow_x, arrow_y)
+
+            painter.setBrush(self._ARROW_BRUSH)
+            painter.drawPolygon(triangle)
+        finally:
+            painter.end()
 
 
 class IconButton(QtWidgets.QPushButton):
     """Custom button with icon drawing capabilities."""
 
+    # Rendered icons shared by all buttons, keyed by
+    # (icon_type, size, hovered, device pixel ratio)
+    _pixmap_cache: dict[tuple[str, int, bool, float], QtGui.QPixmap] = {}
+
+    _HOVER_BRUSH = QtGui.QBrush(QtGui.QColor(70, 70, 70, 150))
+    _ICON_PEN = QtGui.QPen(QtGui.QColor(220, 220, 220), 2, QtCore.Qt.PenStyle.SolidLine, QtCore.Qt.PenCapStyle.RoundCap, QtCore.Qt.PenJoinStyle.RoundJoin)
+    _ICON_BRUSH = QtGui.QBrush(QtGui.QColor(220, 220, 220))
+
     def __init__(self, icon_type: str, size: int = 32, parent=None):
         super().__init__(parent)
         self.icon_type = icon_type
         self.icon_size = size
         self.setFixedSize(size, size)
+        # Fixed size, so the geometry the icon is drawn from never changes
+        self._rect = QtCore.QRect(0, 0, size, size)
+        self._center = size // 2
         self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
 
+    def enterEvent(self, event: QtGui.QEnterEvent) -> None:
+        super().enterEvent(event)
+        self.update()
+
+    def leaveEvent(self, event: QtCore.QEvent) -> None:
+        super().leaveEvent(event)
+        self.update()
+
     def paintEvent(self, event: QtGui.QPaintEvent):
-        """Custom paint for modern icon buttons."""
+        """Blit the cached rendering for the current icon and hover state."""
         painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._icon_pixmap(self.underMouse()))
+        painter.end()
+
+    def _icon_pixmap(self, hovered: bool) -> QtGui.QPixmap:
+        """Return the rendered icon, drawing it on first use."""
+        dpr = self.devicePixelRatioF()
+        key = (self.icon_type, self.icon_size, hovered, dpr)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is None:
+            side = round(self.icon_size * dpr)
+            pixmap = QtGui.QPixmap(side, side)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+            painter = QtGui.QPainter(pixmap)
+            self._render_icon(painter, hovered)
+            painter.end()
+            self._pixmap_cache[key] = pixmap
+        return pixmap
+
+    @staticmethod
+    def _draw_lines(painter: QtGui.QPainter, lines: list[QtCore.QLine], dx: int, dy: int) -> None:
+        """Draw centre-relative line segments offset by (dx, dy) in one call."""
+        painter.translate(dx, dy)
+        painter.drawLines(lines)
+        painter.translate(-dx, -dy)
+
+    def _render_icon(self, painter: QtGui.QPainter, hovered: bool) -> None:
+        """Draw the hover background and icon glyph."""
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
 
         # Background on hover (slightly inset for better proportions)
-        if self.underMouse():
-            painter.setBrush(QtGui.QColor(70, 70, 70, 150))
+        if hovered:
+            painter.setBrush(self._HOVER_BRUSH)
             painter.setPen(QtCore.Qt.PenStyle.NoPen)
             m = 2 if self.icon_size <= 32 else 1
-            painter.drawRoundedRect(self.rect().adjusted(m, m, -m, -m), 5, 5)
+            painter.drawRoundedRect(self._rect.adjusted(m, m, -m, -m), 5, 5)
 
         # Draw icon
-        painter.setPen(QtGui.QPen(QtGui.QColor(220, 220, 220), 2, QtCore.Qt.PenStyle.SolidLine, QtCore.Qt.PenCapStyle.RoundCap, QtCore.Qt.PenJoinStyle.RoundJoin))
+        painter.setPen(self._ICON_PEN)
 
-        center_x = self.width() // 2
-        center_y = self.height() // 2
+        center_x = center_y = self._center
 
         if self.icon_type == "eye":
             # Draw eye icon
             painter.drawEllipse(center_x - 8, center_y - 4, 16, 8)
-            painter.setBrush(QtGui.QColor(220, 220, 220))
+            painter.setBrush(self._ICON_BRUSH)
             painter.drawEllipse(center_x - 3, center_y - 3, 6, 6)
 
         elif self.icon_type == "eye-slash":
             # Draw eye with slash
             painter.drawEllipse(center_x - 8, center_y - 4, 16, 8)
-            painter.setBrush(QtGui.QColor(220, 220, 220))
+            painter.setBrush(self._ICON_BRUSH)
             painter.drawEllipse(center_x - 3, center_y - 3, 6, 6)
             painter.drawLine(center_x - 10, center_y - 6, center_x + 10, center_y + 6)
 
         elif self.icon_type == "close":
             # Draw X icon
-            painter.drawLine(center_x - 6, center_y - 6, center_x + 6, center_y + 6)
-            painter.drawLine(center_x + 6, center_y - 6, center_x - 6, center_y + 6)
+            self._draw_lines(painter, _CLOSE_LINES, center_x, center_y)
 
         elif self.icon_type == "plus":
             # Draw + icon
@@ -147,17 +291,12 @@ class IconButton(QtWidgets.QPushButton):
 
         elif self.icon_type == "play":
             # Draw play triangle (larger to match plus icon scale)
-            painter.setBrush(QtGui.QColor(220, 220, 220))
-            triangle = QtGui.QPolygon([
-                QtCore.QPoint(center_x - 6, center_y - 9),
-                QtCore.QPoint(center_x - 6, center_y + 9),
-                QtCore.QPoint(center_x + 10, center_y)
-            ])
-            painter.drawPolygon(triangle)
+            painter.setBrush(self._ICON_BRUSH)
+            painter.drawPolygon(_PLAY_TRIANGLE.translated(center_x, center_y))
 
         elif self.icon_type == "stop":
             # Draw stop square
-            painter.setBrush(QtGui.QColor(220, 220, 220))
+            painter.setBrush(self._ICON_BRUSH)
             painter.drawRect(center_x - 6, center_y - 6, 12, 12)
 
         elif self.icon_type == "refresh":
@@ -167,51 +306,27 @@ class IconButton(QtWidgets.QPushButton):
             rect = QtCore.QRect(center_x - 8, center_y - 8, 16, 16)
             painter.drawArc(rect, 45 * 16, 270 * 16)
             # Draw arrow head
-            arrow_points = QtGui.QPolygon([
-                QtCore.QPoint(center_x + 6, center_y - 8),
-                QtCore.QPoint(center_x + 6, center_y - 2),
-                QtCore.QPoint(center_x + 10, center_y - 5)
-            ])
-            painter.setBrush(QtGui.QColor(220, 220, 220))
-            painter.drawPolygon(arrow_points)
+            painter.setBrush(self._ICON_BRUSH)
+            painter.drawPolygon(_REFRESH_ARROW_HEAD.translated(center_x, center_y))
 
         elif self.icon_type == "chevron-left":
             # Draw left-pointing chevron (double arrow)
             painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
-            # First chevron
-            painter.drawLine(center_x + 2, center_y - 6, center_x - 3, center_y)
-            painter.drawLine(center_x - 3, center_y, center_x + 2, center_y + 6)
-            # Second chevron
-            painter.drawLine(center_x + 6, center_y - 6, center_x + 1, center_y)
-            painter.drawLine(center_x + 1, center_y, center_x + 6, center_y + 6)
+            self._draw_lines(painter, _CHEVRON_LEFT_LINES, center_x, center_y)
 
         elif self.icon_type == "chevron-right":
             # Draw right-pointing chevron (double arrow)
             painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
-            # First chevron
-            painter.drawLine(center_x - 6, center_y - 6, center_x - 1, center_y)
-            painter.drawLine(center_x - 1, center_y, center_x - 6, center_y + 6)
-            # Second chevron
-            painter.drawLine(center_x - 2, center_y - 6, center_x + 3, center_y)
-            painter.drawLine(center_x + 3, center_y, center_x - 2, center_y + 6)
+            self._draw_lines(painter, _CHEVRON_RIGHT_LINES, center_x, center_y)
 
         elif self.icon_type == "gear":
             # Gear icon: ring body with 6 flat-topped teeth and center hole
             # Teeth are rounded rectangles; body ring drawn on top hides bases
-            import math
             cx, cy = float(center_x), float(center_y)
             painter.setPen(QtCore.Qt.PenStyle.NoPen)
-            painter.setBrush(QtGui.QColor(220, 220, 220))
+            painter.setBrush(self._ICON_BRUSH)
             # Draw 6 flat-topped teeth as rounded rectangles
-            for i in range(6):
-                painter.save()
-                painter.translate(cx, cy)
-                painter.rotate(i * 60.0)
-                # Wide rounded rect: flat top with rounded corners
-                painter.drawRoundedRect(
-                    QtCore.QRectF(-4.0, -12.0, 8.0, 6.5), 2.0, 2.0
-                )
-                painter.restore()
+            painter.drawPath(_GEAR_TEETH.translated(cx, cy))
             # Draw body ring with center hole (OddEvenFill makes the hole)
             ring = QtGui.QPainterPath()
             ring.setFillRule(QtCore.Qt.FillRule.OddEvenFill)
@@ -225,60 +340,32 @@ class IconButton(QtWidgets.QPushButton):
             # Image frame (rectangle)
             painter.drawRect(center_x - 8, center_y - 6, 12, 12)
             # Mountain shape inside (simple triangle)
-            mountain = QtGui.QPolygon([
-                QtCore.QPoint(center_x - 6, center_y + 4),
-                QtCore.QPoint(center_x - 2, center_y - 1),
-                QtCore.QPoint(center_x + 2, center_y + 4),
-            ])
-            painter.drawPolyline(mountain)
-            # Pencil (diagonal line in bottom-right)
-            painter.drawLine(center_x + 2, center_y + 7, center_x + 9, center_y)
-            # Pencil tip
-            painter.drawLine(center_x + 9, center_y, center_x + 7, center_y + 1)
+            painter.drawPolyline(_IMAGE_MOUNTAIN.translated(center_x, center_y))
+            # Pencil (diagonal line in bottom-right) and its tip
+            self._draw_lines(painter, _IMAGE_PENCIL_LINES, center_x, center_y)
 
         elif self.icon_type == "pencil":
             # Pencil: diagonal rectangle body with triangular tip
             # Oriented from lower-left (tip) to upper-right (eraser)
             painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
             # Body: diagonal rectangle
-            body = QtGui.QPolygon([
-                QtCore.QPoint(center_x - 3, center_y + 2),
-                QtCore.QPoint(center_x + 6, center_y - 7),
-                QtCore.QPoint(center_x + 9, center_y - 4),
-                QtCore.QPoint(center_x, center_y + 5),
-            ])
-            painter.drawPolygon(body)
+            painter.drawPolygon(_PENCIL_BODY.translated(center_x, center_y))
             # Eraser divider line across the body near the top
             painter.drawLine(
                 center_x + 5, center_y - 6,
                 center_x + 8, center_y - 3
             )
             # Tip triangle extending from body to a sharp point
-            tip = QtGui.QPolygon([
-                QtCore.QPoint(center_x - 3, center_y + 2),
-                QtCore.QPoint(center_x, center_y + 5),
-                QtCore.QPoint(center_x - 6, center_y + 8),
-            ])
-            painter.drawPolygon(tip)
+            painter.drawPolygon(_PENCIL_TIP.translated(center_x, center_y))
             # Filled lead at the very tip
-            painter.setBrush(QtGui.QColor(220, 220, 220))
-            lead = QtGui.QPolygon([
-                QtCore.QPoint(center_x - 5, center_y + 5),
-                QtCore.QPoint(center_x - 3, center_y + 7),
-                QtCore.QPoint(center_x - 6, center_y + 8),
-            ])
-            painter.drawPolygon(lead)
+            painter.setBrush(self._ICON_BRUSH)
+            painter.drawPolygon(_PENCIL_LEAD.translated(center_x, center_y))
 
         elif self.icon_type == "home":
             # Draw house icon
             painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
             # Roof (triangle)
-            roof = QtGui.QPolygon([
-                QtCore.QPoint(center_x, center_y - 8),
-                QtCore.QPoint(center_x - 9, center_y - 1),
-                QtCore.QPoint(center_x + 9, center_y - 1),
-            ])
-            painter.drawPolygon(roof)
+            painter.drawPolygon(_HOUSE_ROOF.translated(center_x, center_y))
             # House body (rectangle)
             painter.drawRect(center_x - 6, center_y - 1, 12, 9)
             # Door (small rectangle)
@@ -288,6 +375,9 @@ class IconButton(QtWidgets.QPushButton):
 class OverlayListItem(QtWidgets.QWidget):
     """Custom widget for overlay list items with name, toggle, and delete button."""
 
+    # One rename dialog shared by every item, created on first use
+    _rename_dialog: QtWidgets.QInputDialog | None = None
+
     def __init__(self, name: str, region_id: str, parent=None):
         super().__init__(parent)
         self.region_id = region_id
@@ -301,23 +391,10 @@ class OverlayListItem(QtWidgets.QWidget):
 
         # Name label on the left
         self.name_label = QtWidgets.QLabel(name)
-        self.name_label.setStyleSheet("""
-            color: #EEEEEE;
-            background-color: transparent;
-            font-size: 13px;
-            font-weight: 400;
-        """)
         layout.addWidget(self.name_label, 1)  # Stretch factor
 
         # Rename button (Pencil icon) - moved to the left of eye button
         self.rename_btn = IconButton("pencil")
-        self.rename_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 6px;
-            }
-        """)
         self.rename_btn.setToolTip("Rename Overlay")
         self.rename_btn.clicked.connect(self._start_rename)
         layout.addWidget(self.rename_btn, 0)
@@ -326,13 +403,6 @@ class OverlayListItem(QtWidgets.QWidget):
         self.toggle_btn = IconButton("eye")
         self.toggle_btn.setCheckable(True)
         self.toggle_btn.setChecked(True)  # Enabled by default
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 6px;
-            }
-        """)
         self.toggle_btn.setToolTip("Toggle Overlay Visibility")
         self.toggle_btn.toggled.connect(self._update_toggle_icon)
         layout.addWidget(self.toggle_btn, 0)
@@ -340,35 +410,27 @@ class OverlayListItem(QtWidgets.QWidget):
         # Delete button (X icon)
         self.delete_btn = IconButton("close")
         self.delete_btn.setToolTip("Delete Overlay")
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 6px;
-            }
-        """)
         layout.addWidget(self.delete_btn, 0)
 
+        # Styled by the "Overlay list items" section of the dark theme
         self.setLayout(layout)
-        self.setStyleSheet("""
-            OverlayListItem {
-                background-color: transparent;
-                border-radius: 6px;
-                padding: 2px;
-            }
-            OverlayListItem:hover {
-                background-color: rgba(70, 70, 70, 120);
-            }
-        """)
 
     def _start_rename(self):
-        """Show an inline editor to rename the overlay."""
-        current_name = self.name_label.text()
-        new_name, ok = QtWidgets.QInputDialog.getText(
-            None, "Rename Overlay", "New name:", text=current_name
-        )
-        if ok and new_name.strip():
-            self.name_label.setText(new_name.strip())
+        """Show the rename dialog for the overlay."""
+        dialog = OverlayListItem._rename_dialog
+        if dialog is None:
+            # Unparented like the old static getText() dialog, so it can take
+            # keyboard focus even though the controller window never activates
+            dialog = QtWidgets.QInputDialog()
+            dialog.setWindowTitle("Rename Overlay")
+            dialog.setLabelText("New name:")
+            OverlayListItem._rename_dialog = dialog
+        dialog.setTextValue(self.name_label.text())
+        if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
+            return
+        new_name = dialog.textValue().strip()
+        if new_name:
+            self.name_label.setText(new_name)
 
     def _update_toggle_icon(self, checked: bool):
         """Update the toggle button icon based on state."""